@@ -9,13 +9,340 @@ for different time periods and comparison analyses.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import polars as pl
+except ImportError:  # Polars is an optional accelerator for generate_business_summary
+    pl = None
+
+# Arrow-backed dtypes need pyarrow and pandas >= 2.2 (Arrow duration .dt accessors)
+try:
+    import pyarrow as pa
+    ARROW_BACKEND = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    pa = None
+    ARROW_BACKEND = False
+
+
+# Delivery speed buckets: fast (<= 3 days), standard (4-7 days), slow (8+ days)
+DELIVERY_SPEED_CATEGORIES = ('fast', 'standard', 'slow')
+DELIVERY_SPEED_BIN_EDGES = (3, 7)
+
+# Join keys stored as categoricals by prepare_frames
+ID_COLUMNS = ('order_id', 'customer_id', 'product_id')
+
+# Small integer columns downcast by prepare_frames
+INTEGER_COLUMNS = ('year', 'month', 'review_score')
+
+
+def _to_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a frame to PyArrow-backed dtypes so sums, groupbys, merges and
+    datetime arithmetic run on Arrow kernels. Returns df unchanged when the
+    Arrow backend is unavailable (see ARROW_BACKEND).
+    """
+    if not ARROW_BACKEND:
+        return df
+    
+    # Round-trip through a pyarrow Table rather than convert_dtypes(dtype_backend=
+    # 'pyarrow'), which can overwrite NaT in the caller's datetime64 buffers
+    arrow_df = pa.Table.from_pandas(df, preserve_index=False).to_pandas(types_mapper=pd.ArrowDtype)
+    arrow_df.index = df.index
+    return arrow_df
+
+
+def ensure_datetime(
+    df: pd.DataFrame, 
+    columns: List[str], 
+    format: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Parse timestamp columns to datetime64 once, skipping columns already parsed.
+    
+    Args:
+        df: DataFrame containing the timestamp columns
+        columns: Column names to convert (columns not present are ignored)
+        format: Optional format string passed to pd.to_datetime to skip format inference
+    
+    Returns:
+        DataFrame with the columns as datetime64 (the input itself if nothing needed parsing)
+    """
+    pending = [
+        col for col in columns
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col])
+    ]
+    if not pending:
+        return df
+    
+    return df.assign(**{
+        col: pd.to_datetime(df[col], format=format, cache=True) for col in pending
+    })
+
+
+def _downcast_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df with ID columns as categoricals and small integer columns downcast."""
+    updates = {}
+    
+    for col in INTEGER_COLUMNS:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            downcast = pd.to_numeric(df[col], downcast='integer')
+            if downcast.dtype != df[col].dtype:
+                updates[col] = downcast
+    
+    for col in ID_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            updates[col] = df[col].astype('category')
+    
+    return df.assign(**updates) if updates else df
+
+
+def prepare_frames(
+    sales_data: pd.DataFrame,
+    products_data: pd.DataFrame, 
+    orders_data: pd.DataFrame,
+    customers_data: pd.DataFrame,
+    reviews_data: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Shrink the analysis frames so aggregations stream fewer bytes.
+    
+    ID columns become categoricals (integer codes for groupby/nunique) and
+    year/month/review_score are downcast to the smallest integer type.
+    'price' stays float64 so revenue totals keep cent precision. Frames that
+    are already prepared are returned unchanged.
+    
+    Args:
+        sales_data: DataFrame with delivered sales data
+        products_data: DataFrame with product data
+        orders_data: DataFrame with order data
+        customers_data: DataFrame with customer data
+        reviews_data: DataFrame with review data
+    
+    Returns:
+        Tuple of the prepared frames in the same order
+    """
+    return tuple(
+        _downcast_frame(df)
+        for df in (sales_data, products_data, orders_data, customers_data, reviews_data)
+    )
+
+
+def _calendar_fields(dates: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Year and month numbers of a datetime Series as float arrays (NaN for NaT).
+    
+    Naive datetime64 data is handled with a single datetime64[M] cast and
+    integer arithmetic on the month count, avoiding the .dt accessors'
+    per-call dispatch and intermediate Series; other dtypes (tz-aware,
+    object) fall back to .dt.year / .dt.month.
+    """
+    values = dates.to_numpy()
+    if values.dtype.kind != 'M':
+        return (
+            dates.dt.year.to_numpy(dtype=np.float64, na_value=np.nan),
+            dates.dt.month.to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+    
+    months_since_epoch = values.astype('datetime64[M]').astype(np.int64)
+    years = (months_since_epoch // 12 + 1970).astype(np.float64)
+    months = (months_since_epoch % 12 + 1).astype(np.float64)
+    
+    missing = np.isnat(values)
+    years[missing] = np.nan
+    months[missing] = np.nan
+    
+    return years, months
+
+
+def _split_by_year(sales_data: pd.DataFrame, years: List[int]) -> Dict[int, pd.DataFrame]:
+    """
+    Partition sales data into per-year frames using a single groupby pass.
+    
+    Args:
+        sales_data: DataFrame containing a 'year' column
+        years: Years to extract
+    
+    Returns:
+        Dictionary mapping each requested year to its rows (empty frame if absent)
+    """
+    grouped = sales_data.groupby('year', sort=False)
+    return {
+        year: grouped.get_group(year) if year in grouped.groups else sales_data.iloc[0:0]
+        for year in years
+    }
+
+
+def _sort_by_period(sales_data: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Order sales rows by (year, month) so every period is one contiguous block.
+    
+    Input that is already in period order (e.g. from create_sales_dataset) is
+    returned as-is, so the common case costs one vectorized pass and no copy.
+    
+    Returns:
+        Tuple of the period-ordered frame and its sorted year * 100 + month keys
+    """
+    period_keys = (
+        sales_data['year'].to_numpy(dtype=np.float64, na_value=np.nan) * 100
+        + sales_data['month'].to_numpy(dtype=np.float64, na_value=np.nan)
+    )
+    if np.all(period_keys[1:] >= period_keys[:-1]):
+        return sales_data, period_keys
+    
+    order = np.argsort(period_keys, kind='stable')
+    return sales_data.iloc[order], period_keys[order]
+
+
+def _split_by_period(
+    sales_sorted: pd.DataFrame, 
+    period_keys: np.ndarray,
+    years: List[int], 
+    month: Optional[int] = None
+) -> Dict[int, pd.DataFrame]:
+    """
+    Slice period-ordered sales into per-year frames (optionally one month each)
+    with binary searches instead of full-column masks.
+    
+    Args:
+        sales_sorted: Sales frame from _sort_by_period
+        period_keys: Sorted year * 100 + month keys from _sort_by_period
+        years: Years to extract
+        month: Optional month (1-12) to restrict each year to
+    
+    Returns:
+        Dictionary mapping each requested year to its rows (empty frame if absent)
+    """
+    frames = {}
+    for year in years:
+        first, last = (month, month) if month is not None else (1, 12)
+        # Python ints: narrow numpy years (e.g. int16 from the loader) overflow at year * 100
+        key = int(year) * 100
+        start = np.searchsorted(period_keys, key + int(first), side='left')
+        stop = np.searchsorted(period_keys, key + int(last), side='right')
+        frames[year] = sales_sorted.iloc[start:stop]
+    return frames
+
+
+def _growth_rate(current: float, previous: float) -> float:
+    """Percentage change from previous to current (0 when previous is zero)."""
+    if previous == 0:
+        return 0
+    return ((current - previous) / previous) * 100
+
+
+def _count_unique(values: pd.Series) -> int:
+    """
+    Count distinct non-null values.
+    
+    Categorical input is counted with a bincount over its integer codes,
+    avoiding pandas' per-value hashing in nunique.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        present = np.bincount(codes, minlength=len(values.cat.categories))
+        return int(np.count_nonzero(present))
+    return values.nunique()
+
+
+def _compute_yearly_aggregates(
+    sales_data: pd.DataFrame, 
+    years: List[int],
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None
+) -> Dict[int, Dict[str, float]]:
+    """
+    Compute revenue, order count and average order value for several years in one pass.
+    
+    AOV is revenue divided by distinct orders, which equals the mean of
+    per-order totals without a second groupby over order_id.
+    
+    Args:
+        sales_data: DataFrame with sales data containing 'year', 'order_id', and 'price' columns
+        years: Years to aggregate
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year groupby)
+    
+    Returns:
+        Dictionary mapping each year to 'revenue', 'orders' and 'aov'
+        (0 revenue/orders and NaN AOV for years without sales)
+    """
+    if pre_filtered is not None and all(year in pre_filtered for year in years):
+        revenue = {year: pre_filtered[year]['price'].sum() for year in years}
+        orders = {year: _count_unique(pre_filtered[year]['order_id']) for year in years}
+    else:
+        grouped = sales_data[sales_data['year'].isin(years)].groupby('year', sort=False)
+        revenue = grouped['price'].sum()
+        orders = grouped['order_id'].agg(_count_unique)
+    
+    aggregates = {}
+    for year in years:
+        year_revenue = revenue.get(year, 0.0)
+        year_orders = orders.get(year, 0)
+        aggregates[year] = {
+            'revenue': year_revenue,
+            'orders': year_orders,
+            'aov': year_revenue / year_orders if year_orders else np.nan
+        }
+    
+    return aggregates
+
+
+def _project_revenue_metrics(
+    aggregates: Dict[int, Dict[str, float]], 
+    current_year: int, 
+    comparison_year: int
+) -> Dict[str, float]:
+    """Shape yearly aggregates into the calculate_revenue_metrics result."""
+    current_revenue = aggregates[current_year]['revenue']
+    previous_revenue = aggregates[comparison_year]['revenue']
+    
+    return {
+        'current_revenue': current_revenue,
+        'previous_revenue': previous_revenue,
+        'revenue_growth': _growth_rate(current_revenue, previous_revenue)
+    }
+
+
+def _project_average_order_value(
+    aggregates: Dict[int, Dict[str, float]], 
+    current_year: int, 
+    comparison_year: int
+) -> Dict[str, float]:
+    """Shape yearly aggregates into the calculate_average_order_value result."""
+    current_aov = aggregates[current_year]['aov']
+    previous_aov = aggregates[comparison_year]['aov']
+    
+    return {
+        'current_aov': current_aov,
+        'previous_aov': previous_aov,
+        'aov_growth': _growth_rate(current_aov, previous_aov)
+    }
+
+
+def _project_order_count_metrics(
+    aggregates: Dict[int, Dict[str, float]], 
+    current_year: int, 
+    comparison_year: int
+) -> Dict[str, int]:
+    """Shape yearly aggregates into the calculate_order_count_metrics result."""
+    current_orders = aggregates[current_year]['orders']
+    previous_orders = aggregates[comparison_year]['orders']
+    
+    return {
+        'current_orders': current_orders,
+        'previous_orders': previous_orders,
+        'order_growth': _growth_rate(current_orders, previous_orders)
+    }
 
 
 def calculate_revenue_metrics(
     sales_data: pd.DataFrame, 
     current_year: int = 2023, 
-    comparison_year: int = 2022
+    comparison_year: int = 2022,
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None
 ) -> Dict[str, float]:
     """
     Calculate revenue metrics comparing current year vs previous year.
@@ -24,6 +351,7 @@ def calculate_revenue_metrics(
         sales_data: DataFrame with delivered sales data containing 'year' and 'price' columns
         current_year: Year for current analysis (default: 2023)
         comparison_year: Year for comparison (default: 2022)
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year mask)
     
     Returns:
         Dictionary containing revenue metrics:
@@ -31,46 +359,62 @@ def calculate_revenue_metrics(
         - previous_revenue: Total revenue for comparison year
         - revenue_growth: Revenue growth percentage
     """
-    current_data = sales_data[sales_data['year'] == current_year]
-    previous_data = sales_data[sales_data['year'] == comparison_year]
-    
-    current_revenue = current_data['price'].sum()
-    previous_revenue = previous_data['price'].sum()
-    
-    if previous_revenue == 0:
-        revenue_growth = 0
-    else:
-        revenue_growth = ((current_revenue - previous_revenue) / previous_revenue) * 100
+    aggregates = _compute_yearly_aggregates(
+        sales_data, [current_year, comparison_year], pre_filtered
+    )
     
-    return {
-        'current_revenue': current_revenue,
-        'previous_revenue': previous_revenue,
-        'revenue_growth': revenue_growth
-    }
+    return _project_revenue_metrics(aggregates, current_year, comparison_year)
 
 
-def calculate_monthly_growth_trend(sales_data: pd.DataFrame, year: int = 2023) -> pd.Series:
+def calculate_monthly_growth_trend(
+    sales_data: pd.DataFrame, 
+    year: int = 2023,
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None
+) -> pd.Series:
     """
     Calculate month-over-month growth trend for a specific year.
     
     Args:
         sales_data: DataFrame with sales data containing 'year', 'month', and 'price' columns
         year: Year to analyze (default: 2023)
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year mask)
     
     Returns:
         Series with monthly growth percentages
     """
-    year_data = sales_data[sales_data['year'] == year]
-    monthly_revenue = year_data.groupby('month')['price'].sum()
-    monthly_growth = monthly_revenue.pct_change() * 100
+    ctx = build_business_context(sales_data, year, pre_filtered=pre_filtered)
+    return _monthly_growth_from_ctx(ctx)
+
+
+def _monthly_growth_from_ctx(ctx: 'BusinessContext') -> pd.Series:
+    """
+    Month-over-month growth for ctx.current_year.
     
-    return monthly_growth
+    Monthly revenue is a weighted np.bincount over the month numbers; growth
+    is taken between consecutive months that have sales, as pct_change on
+    the grouped revenue would.
+    """
+    months = ctx.current_sales['month'].to_numpy(dtype=np.float64, na_value=np.nan)
+    prices = ctx.current_sales['price'].to_numpy(dtype=np.float64, na_value=0.0)
+    valid = ~np.isnan(months)
+    months = months[valid].astype(np.int64)
+    
+    sums = np.bincount(months, weights=prices[valid], minlength=13)
+    present = np.flatnonzero(np.bincount(months, minlength=13))
+    monthly_revenue = sums[present]
+    
+    monthly_growth = np.full(len(present), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        monthly_growth[1:] = (monthly_revenue[1:] - monthly_revenue[:-1]) / monthly_revenue[:-1] * 100
+    
+    return pd.Series(monthly_growth, index=pd.Index(present, name='month'), name='price')
 
 
 def calculate_average_order_value(
     sales_data: pd.DataFrame, 
     current_year: int = 2023, 
-    comparison_year: int = 2022
+    comparison_year: int = 2022,
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None
 ) -> Dict[str, float]:
     """
     Calculate average order value metrics comparing current vs previous year.
@@ -79,6 +423,7 @@ def calculate_average_order_value(
         sales_data: DataFrame with sales data containing 'year', 'order_id', and 'price' columns
         current_year: Year for current analysis (default: 2023)
         comparison_year: Year for comparison (default: 2022)
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year mask)
     
     Returns:
         Dictionary containing AOV metrics:
@@ -86,28 +431,18 @@ def calculate_average_order_value(
         - previous_aov: Average order value for comparison year
         - aov_growth: AOV growth percentage
     """
-    current_data = sales_data[sales_data['year'] == current_year]
-    previous_data = sales_data[sales_data['year'] == comparison_year]
-    
-    current_aov = current_data.groupby('order_id')['price'].sum().mean()
-    previous_aov = previous_data.groupby('order_id')['price'].sum().mean()
-    
-    if previous_aov == 0:
-        aov_growth = 0
-    else:
-        aov_growth = ((current_aov - previous_aov) / previous_aov) * 100
+    aggregates = _compute_yearly_aggregates(
+        sales_data, [current_year, comparison_year], pre_filtered
+    )
     
-    return {
-        'current_aov': current_aov,
-        'previous_aov': previous_aov,
-        'aov_growth': aov_growth
-    }
+    return _project_average_order_value(aggregates, current_year, comparison_year)
 
 
 def calculate_order_count_metrics(
     sales_data: pd.DataFrame, 
     current_year: int = 2023, 
-    comparison_year: int = 2022
+    comparison_year: int = 2022,
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None
 ) -> Dict[str, int]:
     """
     Calculate order count metrics comparing current vs previous year.
@@ -116,6 +451,7 @@ def calculate_order_count_metrics(
         sales_data: DataFrame with sales data containing 'year' and 'order_id' columns
         current_year: Year for current analysis (default: 2023)
         comparison_year: Year for comparison (default: 2022)
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year mask)
     
     Returns:
         Dictionary containing order count metrics:
@@ -123,28 +459,184 @@ def calculate_order_count_metrics(
         - previous_orders: Total orders for comparison year
         - order_growth: Order count growth percentage
     """
-    current_data = sales_data[sales_data['year'] == current_year]
-    previous_data = sales_data[sales_data['year'] == comparison_year]
+    aggregates = _compute_yearly_aggregates(
+        sales_data, [current_year, comparison_year], pre_filtered
+    )
+    
+    return _project_order_count_metrics(aggregates, current_year, comparison_year)
+
+
+def _sum_by_category(keys: pd.Series, values: pd.Series, key_name: str) -> pd.DataFrame:
+    """
+    Sum values per key and rank the keys by total, descending.
     
-    current_orders = current_data['order_id'].nunique()
-    previous_orders = previous_data['order_id'].nunique()
+    Keys are reduced to integer codes and summed with a single np.bincount
+    scatter-add; only the small per-key totals array is then argsorted, so
+    there is no pandas groupby, sort_values or reset_index on the way out.
+    Missing keys are dropped and missing values count as zero, as in
+    groupby().sum(). Ties keep label order.
     
-    if previous_orders == 0:
-        order_growth = 0
+    Args:
+        keys: Group labels aligned with values (categorical preferred)
+        values: Numeric values to sum
+        key_name: Column name for the labels in the result
+    
+    Returns:
+        DataFrame with key_name and 'price' columns ranked by total
+    """
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        codes = keys.cat.codes.to_numpy()
+        labels = keys.cat.categories
     else:
-        order_growth = ((current_orders - previous_orders) / previous_orders) * 100
+        codes, labels = pd.factorize(keys)
     
-    return {
-        'current_orders': current_orders,
-        'previous_orders': previous_orders,
-        'order_growth': order_growth
-    }
+    weights = values.to_numpy(dtype=np.float64, na_value=0.0)
+    valid = codes >= 0
+    
+    sums = np.bincount(codes[valid], weights=weights[valid], minlength=len(labels))
+    observed = np.flatnonzero(np.bincount(codes[valid], minlength=len(labels)))
+    ranked = observed[np.argsort(-sums[observed], kind='stable')]
+    
+    return pd.DataFrame({
+        key_name: labels[ranked],
+        'price': sums[ranked]
+    })
+
+
+def build_dimension_lookups(
+    products_data: Optional[pd.DataFrame] = None,
+    orders_data: Optional[pd.DataFrame] = None,
+    customers_data: Optional[pd.DataFrame] = None
+) -> Dict[str, pd.Series]:
+    """
+    Build id-indexed lookup Series for the dimension tables.
+    
+    Building these once and passing them to the category and geographic
+    metrics replaces a merge per call with a Series.map / DataFrame.join
+    against an index whose hash table is built once and reused.
+    
+    Args:
+        products_data: DataFrame with 'product_id' and 'product_category_name' (optional)
+        orders_data: DataFrame with 'order_id' and 'customer_id' (optional)
+        customers_data: DataFrame with 'customer_id' and 'customer_state' (optional)
+    
+    Returns:
+        Dictionary with any of:
+        - product_category: product_id -> product_category_name (categorical)
+        - order_customer: order_id -> customer_id
+        - customer_state: customer_id -> customer_state (categorical)
+    """
+    lookups = {}
+    
+    # Category and state values are categorical so revenue can be summed by integer code
+    if products_data is not None:
+        lookups['product_category'] = (
+            products_data.set_index('product_id')['product_category_name'].astype('category')
+        )
+    
+    if orders_data is not None:
+        lookups['order_customer'] = orders_data.set_index('order_id')['customer_id']
+    
+    if customers_data is not None:
+        lookups['customer_state'] = (
+            customers_data.set_index('customer_id')['customer_state'].astype('category')
+        )
+    
+    return lookups
+
+
+@dataclass
+class BusinessContext:
+    """
+    Year-sliced and pre-joined sales frames shared by the metric functions.
+    
+    Built once by build_business_context so every *_from_ctx metric reads
+    the same slices and joins instead of recomputing them.
+    
+    Attributes:
+        current_year: Year for current analysis
+        comparison_year: Year for comparison (None for single-year metrics)
+        current_sales: Sales rows for current_year
+        previous_sales: Sales rows for comparison_year (None if not requested)
+        sales_cat: current_sales 'product_id'/'price' with 'product_category_name' attached
+        sales_geo: current_sales 'order_id'/'price' with 'customer_id'/'customer_state' attached
+    """
+    current_year: int
+    comparison_year: Optional[int]
+    current_sales: pd.DataFrame
+    previous_sales: Optional[pd.DataFrame] = None
+    sales_cat: Optional[pd.DataFrame] = None
+    sales_geo: Optional[pd.DataFrame] = None
+    
+    @property
+    def sales_by_year(self) -> Dict[int, pd.DataFrame]:
+        """Mapping of year to sales rows, usable as a pre_filtered partition."""
+        frames = {self.current_year: self.current_sales}
+        if self.comparison_year is not None and self.previous_sales is not None:
+            frames[self.comparison_year] = self.previous_sales
+        return frames
+
+
+def build_business_context(
+    sales_data: pd.DataFrame,
+    current_year: int = 2023,
+    comparison_year: Optional[int] = None,
+    lookups: Optional[Dict[str, pd.Series]] = None,
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None
+) -> BusinessContext:
+    """
+    Slice sales by year and attach dimension attributes once.
+    
+    Args:
+        sales_data: DataFrame with sales data containing a 'year' column
+        current_year: Year for current analysis (default: 2023)
+        comparison_year: Optional year for comparison
+        lookups: Optional dimension lookups from build_dimension_lookups; the
+            category/geographic joins are only built for lookups present
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year groupby)
+    
+    Returns:
+        BusinessContext for the requested years
+    """
+    years = [current_year] if comparison_year is None else [current_year, comparison_year]
+    frames = dict(pre_filtered or {})
+    missing = [year for year in years if year not in frames]
+    if missing:
+        frames.update(_split_by_year(sales_data, missing))
+    
+    current_sales = frames[current_year]
+    lookups = lookups or {}
+    
+    sales_cat = None
+    if 'product_category' in lookups:
+        sales_cat = current_sales[['product_id', 'price']].assign(
+            product_category_name=current_sales['product_id'].map(lookups['product_category'])
+        )
+    
+    sales_geo = None
+    if 'order_customer' in lookups and 'customer_state' in lookups:
+        sales_geo = (
+            current_sales[['order_id', 'price']]
+            .join(lookups['order_customer'], on='order_id')
+            .join(lookups['customer_state'], on='customer_id')
+        )
+    
+    return BusinessContext(
+        current_year=current_year,
+        comparison_year=comparison_year,
+        current_sales=current_sales,
+        previous_sales=frames[comparison_year] if comparison_year is not None else None,
+        sales_cat=sales_cat,
+        sales_geo=sales_geo
+    )
 
 
 def calculate_product_category_performance(
     sales_data: pd.DataFrame, 
     products_data: pd.DataFrame, 
-    year: int = 2023
+    year: int = 2023,
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None,
+    lookups: Optional[Dict[str, pd.Series]] = None
 ) -> pd.DataFrame:
     """
     Calculate revenue performance by product category for a specific year.
@@ -153,33 +645,36 @@ def calculate_product_category_performance(
         sales_data: DataFrame with sales data containing 'year', 'product_id', and 'price' columns
         products_data: DataFrame with product data containing 'product_id' and 'product_category_name'
         year: Year to analyze (default: 2023)
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year mask)
+        lookups: Optional dimension lookups from build_dimension_lookups (built per call if omitted)
     
     Returns:
         DataFrame with product categories ranked by revenue
     """
-    year_data = sales_data[sales_data['year'] == year]
+    if lookups is None:
+        lookups = build_dimension_lookups(products_data=products_data)
     
-    sales_categories = pd.merge(
-        products_data[['product_id', 'product_category_name']],
-        year_data[['product_id', 'price']]
+    ctx = build_business_context(
+        sales_data, year, pre_filtered=pre_filtered,
+        lookups={'product_category': lookups['product_category']}
     )
-    
-    category_performance = (
-        sales_categories
-        .groupby('product_category_name')['price']
-        .sum()
-        .sort_values(ascending=False)
-        .reset_index()
+    return _category_performance_from_ctx(ctx)
+
+
+def _category_performance_from_ctx(ctx: BusinessContext) -> pd.DataFrame:
+    """Category revenue ranking from the context's pre-joined category sales."""
+    return _sum_by_category(
+        ctx.sales_cat['product_category_name'], ctx.sales_cat['price'], 'product_category_name'
     )
-    
-    return category_performance
 
 
 def calculate_geographic_performance(
     sales_data: pd.DataFrame, 
     orders_data: pd.DataFrame,
     customers_data: pd.DataFrame,
-    year: int = 2023
+    year: int = 2023,
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None,
+    lookups: Optional[Dict[str, pd.Series]] = None
 ) -> pd.DataFrame:
     """
     Calculate revenue performance by state/geographic region.
@@ -189,38 +684,34 @@ def calculate_geographic_performance(
         orders_data: DataFrame with order data containing 'order_id' and 'customer_id'
         customers_data: DataFrame with customer data containing 'customer_id' and 'customer_state'
         year: Year to analyze (default: 2023)
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year mask)
+        lookups: Optional dimension lookups from build_dimension_lookups (built per call if omitted)
     
     Returns:
         DataFrame with states ranked by revenue
     """
-    year_data = sales_data[sales_data['year'] == year]
+    if lookups is None:
+        lookups = build_dimension_lookups(orders_data=orders_data, customers_data=customers_data)
     
-    # Merge sales with customer data
-    sales_customers = pd.merge(
-        year_data[['order_id', 'price']], 
-        orders_data[['order_id', 'customer_id']]
+    ctx = build_business_context(
+        sales_data, year, pre_filtered=pre_filtered,
+        lookups={key: lookups[key] for key in ('order_customer', 'customer_state')}
     )
-    
-    sales_states = pd.merge(
-        sales_customers, 
-        customers_data[['customer_id', 'customer_state']]
-    )
-    
-    geographic_performance = (
-        sales_states
-        .groupby('customer_state')['price']
-        .sum()
-        .sort_values(ascending=False)
-        .reset_index()
+    return _geographic_performance_from_ctx(ctx)
+
+
+def _geographic_performance_from_ctx(ctx: BusinessContext) -> pd.DataFrame:
+    """State revenue ranking from the context's pre-joined geographic sales."""
+    return _sum_by_category(
+        ctx.sales_geo['customer_state'], ctx.sales_geo['price'], 'customer_state'
     )
-    
-    return geographic_performance
 
 
 def calculate_delivery_performance_metrics(
     sales_data: pd.DataFrame, 
     reviews_data: pd.DataFrame,
-    year: int = 2023
+    year: int = 2023,
+    pre_filtered: Optional[Dict[int, pd.DataFrame]] = None
 ) -> Dict[str, float]:
     """
     Calculate delivery performance and customer satisfaction metrics.
@@ -229,6 +720,7 @@ def calculate_delivery_performance_metrics(
         sales_data: DataFrame with sales data containing delivery dates and timestamps
         reviews_data: DataFrame with review data containing 'order_id' and 'review_score'
         year: Year to analyze (default: 2023)
+        pre_filtered: Optional mapping of year to pre-filtered sales rows (skips the year mask)
     
     Returns:
         Dictionary containing delivery performance metrics:
@@ -238,36 +730,58 @@ def calculate_delivery_performance_metrics(
         - standard_delivery_score: Average review score for standard deliveries (4-7 days)
         - slow_delivery_score: Average review score for slow deliveries (8+ days)
     """
-    year_data = sales_data[sales_data['year'] == year].copy()
+    ctx = build_business_context(sales_data, year, pre_filtered=pre_filtered)
+    return _delivery_performance_from_ctx(ctx, _dedupe_reviews(reviews_data))
+
+
+def _dedupe_reviews(reviews_data: pd.DataFrame) -> pd.DataFrame:
+    """Keep one review per order (the last one) so order-level joins are one-to-one."""
+    return reviews_data.drop_duplicates('order_id', keep='last')
+
+
+def _delivery_performance_from_ctx(
+    ctx: BusinessContext, 
+    reviews_data: pd.DataFrame
+) -> Dict[str, float]:
+    """Delivery speed and review metrics for ctx.current_year (reviews unique per order)."""
+    # Project the three columns used before any parsing, so a conversion
+    # never copies the full width of the sales slice
+    date_cols = ['order_delivered_customer_date', 'order_purchase_timestamp']
+    year_data = ensure_datetime(ctx.current_sales[['order_id'] + date_cols], date_cols)
     
-    # Calculate delivery speed in days
-    year_data['delivery_speed'] = (
-        pd.to_datetime(year_data['order_delivered_customer_date']) - 
-        pd.to_datetime(year_data['order_purchase_timestamp'])
-    ).dt.days
+    # Calculate delivery speed in days; speed is an order-level value, so keep one row per order
+    year_data = year_data[['order_id']].assign(
+        delivery_speed=(
+            year_data['order_delivered_customer_date'] - 
+            year_data['order_purchase_timestamp']
+        ).dt.days
+    ).drop_duplicates('order_id')
     
-    # Merge with reviews
+    # Merge with reviews (one row per order on both sides)
     delivery_reviews = pd.merge(
-        year_data[['order_id', 'delivery_speed']], 
-        reviews_data[['order_id', 'review_score']]
-    ).drop_duplicates()
-    
-    # Categorize delivery speed
-    def categorize_delivery_speed(days):
-        if days <= 3:
-            return 'fast'
-        elif days <= 7:
-            return 'standard'
-        else:
-            return 'slow'
+        year_data, 
+        reviews_data[['order_id', 'review_score']],
+        how='inner',
+        validate='1:1'
+    )
     
-    delivery_reviews['delivery_category'] = delivery_reviews['delivery_speed'].apply(categorize_delivery_speed)
+    # Bin delivery speed in one vectorized pass; missing speeds sort past the
+    # last edge and land in 'slow', matching the previous row-wise rule
+    days = delivery_reviews['delivery_speed'].to_numpy(dtype=np.float64, na_value=np.nan)
+    delivery_category = pd.Categorical.from_codes(
+        np.digitize(days, DELIVERY_SPEED_BIN_EDGES, right=True),
+        categories=DELIVERY_SPEED_CATEGORIES
+    )
     
-    # Calculate metrics
-    avg_delivery_days = delivery_reviews['delivery_speed'].mean()
-    avg_review_score = delivery_reviews['review_score'].mean()
+    # Calculate metrics in float64 so nullable and Arrow columns give NaN,
+    # not pd.NA, when the year has no reviewed deliveries
+    review_scores = delivery_reviews['review_score'].astype('float64')
+    avg_delivery_days = delivery_reviews['delivery_speed'].astype('float64').mean()
+    avg_review_score = review_scores.mean()
     
-    delivery_category_scores = delivery_reviews.groupby('delivery_category')['review_score'].mean()
+    delivery_category_scores = (
+        review_scores.groupby(delivery_category, observed=True).mean()
+    )
     
     return {
         'avg_delivery_days': avg_delivery_days,
@@ -289,11 +803,14 @@ def calculate_order_status_distribution(orders_data: pd.DataFrame, year: int = 2
     Returns:
         Series with order status distribution as percentages
     """
-    orders_data = orders_data.copy()
-    orders_data['year'] = pd.to_datetime(orders_data['order_purchase_timestamp']).dt.year
+    orders_data = ensure_datetime(orders_data, ['order_purchase_timestamp'])
+    years, _ = _calendar_fields(orders_data['order_purchase_timestamp'])
     
-    year_data = orders_data[orders_data['year'] == year]
-    status_distribution = year_data['order_status'].value_counts(normalize=True) * 100
+    # value_counts on a categorical status runs over integer codes; drop unobserved statuses
+    status_distribution = (
+        orders_data.loc[years == year, 'order_status'].value_counts(normalize=True) * 100
+    )
+    status_distribution = status_distribution[status_distribution > 0]
     
     return status_distribution
 
@@ -316,26 +833,204 @@ def filter_data_by_period(
     Returns:
         Filtered DataFrame
     """
-    filtered_data = data.copy()
-    
-    # Ensure datetime conversion
-    filtered_data[date_column] = pd.to_datetime(filtered_data[date_column])
+    dates = data[date_column]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
     
-    # Extract year and month for filtering
-    filtered_data['filter_year'] = filtered_data[date_column].dt.year
-    filtered_data['filter_month'] = filtered_data[date_column].dt.month
+    # Build a single boolean mask; no copy of the input and no temporary columns
+    mask = np.ones(len(data), dtype=bool)
+    years, months = _calendar_fields(dates)
     
-    # Apply filters
     if year is not None:
-        filtered_data = filtered_data[filtered_data['filter_year'] == year]
+        mask &= years == year
     
     if month is not None:
-        filtered_data = filtered_data[filtered_data['filter_month'] == month]
+        mask &= months == month
     
-    # Clean up temporary columns
-    filtered_data = filtered_data.drop(['filter_year', 'filter_month'], axis=1)
+    return data[mask]
+
+
+def _to_lazy(df: pd.DataFrame) -> 'pl.LazyFrame':
+    """Convert a pandas frame to a Polars LazyFrame with pandas ID categoricals as strings."""
+    lazy = pl.from_pandas(df).lazy()
+    id_columns = [col for col in ID_COLUMNS if col in df.columns]
+    if id_columns:
+        lazy = lazy.with_columns(pl.col(id_columns).cast(pl.String))
+    return lazy
+
+
+def _generate_business_summary_polars(
+    sales_data: pd.DataFrame,
+    products_data: pd.DataFrame, 
+    orders_data: pd.DataFrame,
+    customers_data: pd.DataFrame,
+    reviews_data: pd.DataFrame,
+    current_year: int,
+    comparison_year: int,
+    filter_month: Optional[int]
+) -> Dict[str, any]:
+    """
+    Polars implementation of generate_business_summary.
+    
+    All sections are expressed as lazy queries over a single conversion of the
+    input frames and executed together with pl.collect_all, so Polars can share
+    scans and schedule the aggregations across cores. Results are converted
+    back to the same pandas/dict structures returned by the pandas engine, with
+    label columns as plain strings and empty averages as NaN.
+    """
+    date_cols = ['order_purchase_timestamp', 'order_delivered_customer_date']
+    sales_cols = ['year', 'month', 'order_id', 'product_id', 'price'] + date_cols
+    sales = _to_lazy(ensure_datetime(sales_data[sales_cols], date_cols))
+    orders = _to_lazy(ensure_datetime(
+        orders_data[['order_id', 'customer_id', 'order_status', 'order_purchase_timestamp']],
+        ['order_purchase_timestamp']
+    ))
+    products = _to_lazy(products_data[['product_id', 'product_category_name']])
+    customers = _to_lazy(customers_data[['customer_id', 'customer_state']])
+    reviews = _to_lazy(reviews_data[['order_id', 'review_score']])
+    
+    # Apply month filter if specified
+    if filter_month is not None:
+        sales = sales.filter(pl.col('order_purchase_timestamp').dt.month() == filter_month)
+        orders = orders.filter(pl.col('order_purchase_timestamp').dt.month() == filter_month)
+    
+    current = sales.filter(pl.col('year') == current_year)
+    
+    # Revenue, AOV and order counts for both years in one grouped pass
+    yearly = (
+        sales
+        .filter(pl.col('year').is_in([current_year, comparison_year]))
+        .group_by('year')
+        .agg(
+            revenue=pl.col('price').sum(),
+            orders=pl.col('order_id').n_unique(),
+        )
+        .with_columns(aov=pl.col('revenue') / pl.col('orders'))
+    )
+    
+    monthly = (
+        current
+        .group_by('month')
+        .agg(pl.col('price').sum())
+        .sort('month')
+        .with_columns(pl.col('price').pct_change() * 100)
+    )
+    
+    category = (
+        current.select(['product_id', 'price'])
+        .join(products, on='product_id', how='inner')
+        .filter(pl.col('product_category_name').is_not_null())
+        .group_by('product_category_name')
+        .agg(pl.col('price').sum())
+        .sort('price', descending=True)
+        .with_columns(pl.col('product_category_name').cast(pl.String))
+    )
+    
+    geographic = (
+        current.select(['order_id', 'price'])
+        .join(orders.select(['order_id', 'customer_id']), on='order_id', how='inner')
+        .join(customers, on='customer_id', how='inner')
+        .filter(pl.col('customer_state').is_not_null())
+        .group_by('customer_state')
+        .agg(pl.col('price').sum())
+        .sort('price', descending=True)
+        .with_columns(pl.col('customer_state').cast(pl.String))
+    )
+    
+    # Delivery speed in whole days, floored like pandas' Timedelta.days
+    delivery_reviews = (
+        current
+        .select(
+            'order_id',
+            delivery_speed=(
+                pl.col('order_delivered_customer_date') - pl.col('order_purchase_timestamp')
+            ).dt.total_nanoseconds() // 86_400_000_000_000,
+        )
+        .join(reviews, on='order_id', how='inner')
+        .unique()
+        .with_columns(
+            delivery_category=pl.when(pl.col('delivery_speed') <= 3).then(pl.lit('fast'))
+            .when(pl.col('delivery_speed') <= 7).then(pl.lit('standard'))
+            .otherwise(pl.lit('slow'))
+        )
+    )
+    delivery_overall = delivery_reviews.select(
+        avg_delivery_days=pl.col('delivery_speed').mean(),
+        avg_review_score=pl.col('review_score').mean(),
+    )
+    delivery_by_category = (
+        delivery_reviews
+        .group_by('delivery_category')
+        .agg(pl.col('review_score').mean())
+    )
+    
+    status = (
+        orders
+        .filter(pl.col('order_purchase_timestamp').dt.year() == current_year)
+        .group_by('order_status')
+        .agg(pl.len().alias('count'))
+        .with_columns(proportion=pl.col('count') / pl.col('count').sum() * 100)
+        .sort('count', descending=True)
+    )
+    
+    (
+        yearly, monthly, category, geographic,
+        delivery_overall, delivery_by_category, status
+    ) = pl.collect_all([
+        yearly, monthly, category, geographic,
+        delivery_overall, delivery_by_category, status
+    ])
+    
+    by_year = {row['year']: row for row in yearly.iter_rows(named=True)}
+    aggregates = {
+        year: by_year.get(year, {'revenue': 0.0, 'orders': 0, 'aov': np.nan})
+        for year in (current_year, comparison_year)
+    }
     
-    return filtered_data
+    summary = {}
+    
+    summary['revenue'] = _project_revenue_metrics(aggregates, current_year, comparison_year)
+    summary['aov'] = _project_average_order_value(aggregates, current_year, comparison_year)
+    summary['orders'] = _project_order_count_metrics(aggregates, current_year, comparison_year)
+    
+    if filter_month is None:
+        summary['monthly_growth'] = monthly.to_pandas().set_index('month')['price']
+    
+    summary['category_performance'] = category.to_pandas()
+    summary['geographic_performance'] = geographic.to_pandas()
+    
+    # Polars means over no rows are null; report NaN like the pandas engine
+    overall = {
+        key: np.nan if value is None else value
+        for key, value in delivery_overall.row(0, named=True).items()
+    }
+    category_scores = dict(delivery_by_category.iter_rows())
+    summary['delivery_performance'] = {
+        'avg_delivery_days': overall['avg_delivery_days'],
+        'avg_review_score': overall['avg_review_score'],
+        'fast_delivery_score': category_scores.get('fast', 0),
+        'standard_delivery_score': category_scores.get('standard', 0),
+        'slow_delivery_score': category_scores.get('slow', 0)
+    }
+    
+    summary['order_status_distribution'] = (
+        status.to_pandas().set_index('order_status')['proportion']
+    )
+    
+    return summary
+
+
+def _run_sections(
+    sections: Dict[str, Callable[[], any]], 
+    max_workers: Optional[int]
+) -> Dict[str, any]:
+    """Evaluate independent summary sections, in a thread pool unless max_workers is 1."""
+    if max_workers == 1:
+        return {key: section() for key, section in sections.items()}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {key: executor.submit(section) for key, section in sections.items()}
+        return {key: future.result() for key, future in futures.items()}
 
 
 def generate_business_summary(
@@ -346,7 +1041,10 @@ def generate_business_summary(
     reviews_data: pd.DataFrame,
     current_year: int = 2023,
     comparison_year: int = 2022,
-    filter_month: Optional[int] = None
+    filter_month: Optional[int] = None,
+    engine: str = 'pandas',
+    max_workers: Optional[int] = 6,
+    dtype_backend: str = 'numpy'
 ) -> Dict[str, any]:
     """
     Generate a comprehensive business performance summary.
@@ -360,48 +1058,103 @@ def generate_business_summary(
         current_year: Year for current analysis (default: 2023)
         comparison_year: Year for comparison (default: 2022)
         filter_month: Optional month filter (1-12)
+        engine: 'pandas' (default) or 'polars' to run all sections as one
+            multi-threaded Polars lazy query (requires polars)
+        max_workers: Threads used to compute the pandas sections concurrently
+            (default: 6); set to 1 to run them sequentially for debugging
+        dtype_backend: 'numpy' (default) or 'pyarrow' to convert the inputs to
+            Arrow-backed dtypes first (requires pyarrow and pandas >= 2.2;
+            falls back to the NumPy backend otherwise)
     
     Returns:
         Dictionary containing comprehensive business metrics
     """
-    # Apply month filter if specified
-    if filter_month is not None:
-        sales_data = filter_data_by_period(sales_data, month=filter_month)
-        orders_data = filter_data_by_period(orders_data, month=filter_month)
+    # Optionally move to Arrow-backed columns (no-op on pandas < 2.2 or without pyarrow)
+    if dtype_backend == 'pyarrow':
+        sales_data, products_data, orders_data, customers_data, reviews_data = (
+            _to_arrow(df)
+            for df in (sales_data, products_data, orders_data, customers_data, reviews_data)
+        )
+    elif dtype_backend != 'numpy':
+        raise ValueError(f"Unknown dtype_backend: {dtype_backend!r}")
     
-    summary = {}
+    # Downcast IDs and small integers once so every aggregation streams fewer bytes
+    sales_data, products_data, orders_data, customers_data, reviews_data = prepare_frames(
+        sales_data, products_data, orders_data, customers_data, reviews_data
+    )
+    
+    # Parse timestamps once so downstream metrics skip repeated pd.to_datetime calls
+    sales_data = ensure_datetime(
+        sales_data, ['order_purchase_timestamp', 'order_delivered_customer_date']
+    )
+    orders_data = ensure_datetime(orders_data, ['order_purchase_timestamp'])
+    
+    # Dedupe reviews once at the source so delivery metrics merge one-to-one
+    reviews_data = _dedupe_reviews(reviews_data)
     
-    # Revenue metrics
-    summary['revenue'] = calculate_revenue_metrics(sales_data, current_year, comparison_year)
+    if engine == 'polars':
+        if pl is None:
+            raise ImportError("engine='polars' requires the polars package")
+        return _generate_business_summary_polars(
+            sales_data, products_data, orders_data, customers_data, reviews_data,
+            current_year, comparison_year, filter_month
+        )
+    if engine != 'pandas':
+        raise ValueError(f"Unknown engine: {engine!r}")
+    
+    # Order sales by (year, month) once; each year (and month) is then a
+    # contiguous block found by binary search, which also applies the month filter
+    sales_data, period_keys = _sort_by_period(sales_data)
+    periods = _split_by_period(
+        sales_data, period_keys, [current_year, comparison_year], filter_month
+    )
+    
+    # Apply month filter to orders if specified
+    if filter_month is not None:
+        orders_data = filter_data_by_period(orders_data, month=filter_month)
     
-    # AOV metrics
-    summary['aov'] = calculate_average_order_value(sales_data, current_year, comparison_year)
+    # Slice sales by year and join dimension attributes once for all metrics
+    ctx = build_business_context(
+        sales_data, current_year, comparison_year,
+        lookups=build_dimension_lookups(products_data, orders_data, customers_data),
+        pre_filtered=periods
+    )
     
-    # Order count metrics
-    summary['orders'] = calculate_order_count_metrics(sales_data, current_year, comparison_year)
+    # Independent sections, run concurrently (pandas/NumPy kernels release the GIL)
+    sections = {
+        # Revenue, AOV and order count metrics from one fused aggregation
+        'yearly': partial(
+            _compute_yearly_aggregates,
+            sales_data, [current_year, comparison_year], ctx.sales_by_year
+        ),
+        'category_performance': partial(_category_performance_from_ctx, ctx),
+        'geographic_performance': partial(_geographic_performance_from_ctx, ctx),
+        'delivery_performance': partial(_delivery_performance_from_ctx, ctx, reviews_data),
+        'order_status_distribution': partial(
+            calculate_order_status_distribution, orders_data, current_year
+        ),
+    }
     
     # Monthly growth trend (only if not filtering by specific month)
     if filter_month is None:
-        summary['monthly_growth'] = calculate_monthly_growth_trend(sales_data, current_year)
+        sections['monthly_growth'] = partial(_monthly_growth_from_ctx, ctx)
     
-    # Product category performance
-    summary['category_performance'] = calculate_product_category_performance(
-        sales_data, products_data, current_year
-    )
+    results = _run_sections(sections, max_workers)
     
-    # Geographic performance
-    summary['geographic_performance'] = calculate_geographic_performance(
-        sales_data, orders_data, customers_data, current_year
-    )
+    yearly = results['yearly']
+    summary = {
+        'revenue': _project_revenue_metrics(yearly, current_year, comparison_year),
+        'aov': _project_average_order_value(yearly, current_year, comparison_year),
+        'orders': _project_order_count_metrics(yearly, current_year, comparison_year),
+    }
     
-    # Delivery performance
-    summary['delivery_performance'] = calculate_delivery_performance_metrics(
-        sales_data, reviews_data, current_year
-    )
+    if filter_month is None:
+        summary['monthly_growth'] = results['monthly_growth']
     
-    # Order status distribution
-    summary['order_status_distribution'] = calculate_order_status_distribution(
-        orders_data, current_year
-    )
+    for key in (
+        'category_performance', 'geographic_performance',
+        'delivery_performance', 'order_status_distribution'
+    ):
+        summary[key] = results[key]
     
     return summary
\ No newline at end of file
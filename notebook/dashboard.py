@@ -4,6 +4,7 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import os
 import warnings
 
 from data_loader import load_and_process_data
@@ -18,6 +19,13 @@ from business_metrics import (
 
 warnings.filterwarnings('ignore')
 
+# Columns read by the KPI cards and charts; everything else is dropped after loading
+DASHBOARD_COLUMNS = [
+    'order_id', 'year', 'month', 'price',
+    'product_category_name', 'customer_state',
+    'order_purchase_timestamp', 'delivery_days', 'review_score'
+]
+
 st.set_page_config(
     page_title="E-commerce Analytics Dashboard",
     page_icon="📊",
@@ -25,87 +33,143 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for professional styling
-st.markdown("""
-<style>
-    .main > div {
-        padding-top: 2rem;
-    }
-    
-    .metric-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        border: 1px solid #e0e0e0;
-        height: 120px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
+
+@st.cache_resource(show_spinner=False)
+def load_dashboard_css():
+    """Read the dashboard stylesheet once per process"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.css')) as css_file:
+        return f"<style>\n{css_file.read()}</style>"
+
+
+# Custom CSS for professional styling. Streamlit drops elements a rerun does not
+# re-emit, so the (cached) stylesheet is injected on every run rather than once.
+st.markdown(load_dashboard_css(), unsafe_allow_html=True)
+
+
+@st.cache_resource(show_spinner=False)
+def load_dashboard_data():
+    """Load data once per process and share it across reruns (read-only; never pickled or hashed)"""
+    try:
+        loader, processed_data = load_and_process_data('ecommerce_data/')
+        return loader, processed_data
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        return None, None
+
+
+@st.cache_data(show_spinner=False)
+def get_sales_dataset(_loader, year, month, status):
+    """Build and cache the sales dataset for a (year, month, status) filter combination"""
+    sales_data = _loader.create_sales_dataset(
+        year_filter=year,
+        month_filter=month,
+        status_filter=status
+    )
     
-    .metric-value {
-        font-size: 2rem;
-        font-weight: bold;
-        margin: 0;
-        color: #1f1f1f;
-    }
+    # Project to the columns the dashboard reads so cache copies and filters stay narrow
+    return sales_data[[col for col in DASHBOARD_COLUMNS if col in sales_data.columns]]
+
+
+def filter_by_date_range(sales_data, start_date, end_date):
+    """Keep rows purchased on start_date through end_date using raw datetime64 comparisons"""
+    timestamps = sales_data['order_purchase_timestamp'].to_numpy()
+    lower = np.datetime64(start_date, 'D')
+    upper = np.datetime64(end_date, 'D') + np.timedelta64(1, 'D')
     
-    .metric-label {
-        font-size: 0.9rem;
-        color: #666;
-        margin: 0;
-        margin-bottom: 0.5rem;
-    }
+    return sales_data[(timestamps >= lower) & (timestamps < upper)]
+
+
+def get_filtered_sales_dataset(loader, year, month, status, date_bounds=None):
+    """Cached sales dataset for the filters, narrowed to (start_date, end_date) when given"""
+    sales_data = get_sales_dataset(loader, year, month, status)
     
-    .metric-trend {
-        font-size: 0.8rem;
-        margin: 0;
-    }
+    if date_bounds is not None:
+        sales_data = filter_by_date_range(sales_data, *date_bounds)
     
-    .trend-positive {
-        color: #28a745;
-    }
+    return sales_data
+
+
+@st.cache_data(show_spinner=False)
+def get_chart_aggregates(_loader, year, month, status, date_bounds=None):
+    """Build and cache the small chart aggregates, keyed on the scalar filter values rather than a DataFrame"""
+    sales_data = get_filtered_sales_dataset(_loader, year, month, status, date_bounds)
     
-    .trend-negative {
-        color: #dc3545;
-    }
+    aggregates = compute_revenue_aggregates(sales_data)
+    aggregates['delivery'] = compute_delivery_satisfaction(sales_data)
     
+    return aggregates
+
+
+@st.cache_data(show_spinner=False)
+def get_monthly_revenue(_loader, year, month, status, date_bounds=None):
+    """Build and cache only the monthly revenue series, e.g. for the previous-year comparison trace"""
+    return sum_by_month(get_filtered_sales_dataset(_loader, year, month, status, date_bounds))
+
+
+@st.cache_data(show_spinner=False)
+def get_kpi_metrics(_loader, year, comparison_year, month, status, date_bounds=None, comparison_bounds=None):
+    """Compute and cache the KPI metric dicts (current vs comparison year) for a filter combination"""
+    sales_data = get_filtered_sales_dataset(_loader, year, month, status, date_bounds)
+    comparison_data = get_filtered_sales_dataset(_loader, comparison_year, month, status, comparison_bounds)
+    
+    # The yearly metrics split by 'year', so they need both periods in one frame
+    kpi_columns = ['year', 'order_id', 'price']
+    both_years = pd.concat(
+        [sales_data[kpi_columns], comparison_data[kpi_columns]],
+        ignore_index=True
+    )
     
-    .bottom-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        border: 1px solid #e0e0e0;
-        height: 150px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        text-align: center;
-    }
+    aov_metrics = calculate_average_order_value(both_years, year, comparison_year)
+    if pd.isna(aov_metrics['aov_growth']):
+        # No comparison orders: report no change, as the other growth rates do for a zero baseline
+        aov_metrics['aov_growth'] = 0
     
-    .stSelectbox > div > div > div {
-        background-color: white;
-    }
+    monthly_growth = calculate_monthly_growth_trend(sales_data, year)
     
-    .stars {
-        color: #ffc107;
-        font-size: 1.2rem;
+    return {
+        'revenue': calculate_revenue_metrics(both_years, year, comparison_year),
+        'orders': calculate_order_count_metrics(both_years, year, comparison_year),
+        'aov': aov_metrics,
+        'avg_monthly_growth': monthly_growth.mean() if len(monthly_growth) > 0 else 0
     }
-</style>
-""", unsafe_allow_html=True)
 
 
-@st.cache_data
-def load_dashboard_data():
-    """Load and cache data for dashboard"""
+_MISSING_FIG_CACHE = {}
+
+
+def _missing(msg):
+    """Placeholder figure for unavailable data, built once per message and reused"""
+    if msg not in _MISSING_FIG_CACHE:
+        _MISSING_FIG_CACHE[msg] = go.Figure().add_annotation(
+            text=msg,
+            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False
+        )
+    return _MISSING_FIG_CACHE[msg]
+
+
+# Single-line HTML templates for the KPI and bottom cards, filled with one str.format call each
+_KPI_TMPL = (
+    '<div class="metric-card">'
+    '<p class="metric-label">{}</p>'
+    '<p class="metric-value">{}</p>'
+    '<p class="metric-trend" style="color: {};"><span style="font-size: 16px;">{}</span> {:.2f}%</p>'
+    '</div>'
+)
+
+_BOTTOM_CARD_TMPL = (
+    '<div class="bottom-card">'
+    '<div style="font-size: 16px; color: #333; font-weight: 600; margin-bottom: 15px;">{}</div>'
+    '{}{}'
+    '</div>'
+)
+
+
+def shift_back_one_year(date):
+    """Same calendar day one year earlier (Feb 29 maps to Feb 28)"""
     try:
-        loader, processed_data = load_and_process_data('ecommerce_data/')
-        return loader, processed_data
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None, None
+        return date.replace(year=date.year - 1)
+    except ValueError:
+        return date.replace(year=date.year - 1, day=28)
 
 
 def format_currency(value):
@@ -130,17 +194,52 @@ def format_trend(current, previous):
     return f'<span class="{color_class}">{arrow} {abs(change_pct):.2f}%</span>'
 
 
-def create_revenue_trend_chart(current_data, previous_data, current_year, previous_year):
+def sum_by_month(sales_data):
+    """Sum revenue per calendar month with one np.bincount scatter-add over the month numbers"""
+    month_column = sales_data['month']
+    prices = np.nan_to_num(sales_data['price'].to_numpy(dtype=np.float64, na_value=0.0))
+    
+    if isinstance(month_column.dtype, np.dtype) and month_column.dtype.kind in 'iu':
+        # Plain numpy integer months (as the loader stores them) index the accumulator directly;
+        # nullable Int dtypes also report kind 'i' but may hold NA, so they take the masked path
+        months = month_column.to_numpy()
+    else:
+        months = month_column.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(months)
+        months = months[valid].astype(np.int64)
+        prices = prices[valid]
+    
+    sums = np.bincount(months, weights=prices, minlength=13)
+    present = np.flatnonzero(np.bincount(months, minlength=13))
+    
+    return pd.Series(
+        sums[present],
+        index=pd.Index(present, name='month').astype(month_column.dtype),
+        name='price'
+    )
+
+
+def compute_revenue_aggregates(sales_data):
+    """Sum revenue by month, category and state once so every chart reuses the same aggregates"""
+    aggregates = {'month': sum_by_month(sales_data)}
+    
+    if 'product_category_name' in sales_data.columns:
+        aggregates['category'] = sales_data.groupby('product_category_name', observed=True, sort=False)['price'].sum()
+    
+    if 'customer_state' in sales_data.columns:
+        aggregates['state'] = sales_data.groupby('customer_state', observed=True, sort=False)['price'].sum()
+    
+    return aggregates
+
+
+def create_revenue_trend_chart(current_monthly, previous_monthly, current_year, previous_year):
     """Create revenue trend line chart with solid/dashed lines and grid"""
     fig = go.Figure()
     
-    # Group current year data by month
-    current_monthly = current_data.groupby('month')['price'].sum().reset_index()
-    
     # Current period - solid line
-    fig.add_trace(go.Scatter(
-        x=current_monthly['month'],
-        y=current_monthly['price'],
+    fig.add_trace(go.Scattergl(
+        x=current_monthly.index,
+        y=current_monthly.values,
         mode='lines+markers',
         name=f'{current_year}',
         line=dict(color='#007bff', width=3),  # Solid blue line
@@ -148,11 +247,10 @@ def create_revenue_trend_chart(current_data, previous_data, current_year, previo
     ))
     
     # Previous period - dashed line
-    if not previous_data.empty:
-        previous_monthly = previous_data.groupby('month')['price'].sum().reset_index()
-        fig.add_trace(go.Scatter(
-            x=previous_monthly['month'],
-            y=previous_monthly['price'],
+    if previous_monthly is not None and not previous_monthly.empty:
+        fig.add_trace(go.Scattergl(
+            x=previous_monthly.index,
+            y=previous_monthly.values,
             mode='lines+markers',
             name=f'{previous_year}',
             line=dict(color='#6c757d', width=2, dash='dash'),  # Dashed gray line
@@ -179,15 +277,12 @@ def create_revenue_trend_chart(current_data, previous_data, current_year, previo
     return fig
 
 
-def create_category_chart(sales_data):
+def create_category_chart(category_revenue):
     """Create top 10 categories bar chart sorted descending with blue gradient"""
-    if 'product_category_name' not in sales_data.columns:
-        return go.Figure().add_annotation(
-            text="Product category data not available",
-            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False
-        )
+    if category_revenue is None:
+        return _missing("Product category data not available")
     
-    category_revenue = sales_data.groupby('product_category_name')['price'].sum().sort_values(ascending=True).tail(10)
+    category_revenue = category_revenue.nlargest(10).iloc[::-1]
     
     # Create blue gradient (light shade for lower values)
     fig = go.Figure(data=[
@@ -200,9 +295,9 @@ def create_category_chart(sales_data):
                 colorscale=[[0, '#E3F2FD'], [1, '#1976D2']],  # Light blue to dark blue
                 showscale=False
             ),
-            text=[format_currency(x) for x in category_revenue.values],
+            texttemplate='$%{x:.3s}',  # Formatted client-side, e.g. $123k / $1.23M
             textposition='outside',
-            hovertemplate='%{y}<br>Revenue: %{text}<extra></extra>'
+            hovertemplate='%{y}<br>Revenue: $%{x:.3s}<extra></extra>'
         )
     ])
     
@@ -220,16 +315,13 @@ def create_category_chart(sales_data):
     return fig
 
 
-def create_geographic_chart(sales_data):
+def create_geographic_chart(state_revenue):
     """Create top 10 states by revenue bar chart"""
-    if 'customer_state' not in sales_data.columns:
-        return go.Figure().add_annotation(
-            text="Geographic data not available",
-            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False
-        )
+    if state_revenue is None:
+        return _missing("Geographic data not available")
     
     # Get top 10 states by revenue
-    state_revenue = sales_data.groupby('customer_state')['price'].sum().sort_values(ascending=True).tail(10)
+    state_revenue = state_revenue.nlargest(10).iloc[::-1]
     
     fig = go.Figure(data=[
         go.Bar(
@@ -241,9 +333,9 @@ def create_geographic_chart(sales_data):
                 colorscale=[[0, '#FFF3E0'], [1, '#FF9800']],  # Light orange to dark orange
                 showscale=False
             ),
-            text=[format_currency(x) for x in state_revenue.values],
+            texttemplate='$%{x:.3s}',  # Formatted client-side, e.g. $123k / $1.23M
             textposition='outside',
-            hovertemplate='%{y}<br>Revenue: %{text}<extra></extra>'
+            hovertemplate='%{y}<br>Revenue: $%{x:.3s}<extra></extra>'
         )
     ])
     
@@ -261,20 +353,14 @@ def create_geographic_chart(sales_data):
     return fig
 
 
-def create_state_map(sales_data):
+def create_state_map(state_revenue):
     """Create US choropleth map"""
-    if 'customer_state' not in sales_data.columns:
-        return go.Figure().add_annotation(
-            text="Geographic data not available",
-            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False
-        )
-    
-    state_revenue = sales_data.groupby('customer_state')['price'].sum().reset_index()
-    state_revenue.columns = ['state', 'revenue']
+    if state_revenue is None:
+        return _missing("Geographic data not available")
     
     fig = go.Figure(data=go.Choropleth(
-        locations=state_revenue['state'],
-        z=state_revenue['revenue'],
+        locations=state_revenue.index,
+        z=state_revenue.values,
         locationmode='USA-states',
         colorscale='Blues',
         showscale=True,
@@ -291,39 +377,34 @@ def create_state_map(sales_data):
     return fig
 
 
-def create_satisfaction_delivery_chart(sales_data):
-    """Create satisfaction vs delivery time chart"""
+def compute_delivery_satisfaction(sales_data):
+    """Average review score per delivery-time bucket, or None when delivery or review data is missing"""
     if 'delivery_days' not in sales_data.columns or 'review_score' not in sales_data.columns:
-        return go.Figure().add_annotation(
-            text="Delivery or review data not available",
-            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False
-        )
-    
-    # Categorize delivery days
-    def categorize_delivery(days):
-        if pd.isna(days):
-            return 'Unknown'
-        elif days <= 3:
-            return '1-3 days'
-        elif days <= 7:
-            return '4-7 days'
-        else:
-            return '8+ days'
-    
-    sales_data['delivery_category'] = sales_data['delivery_days'].apply(categorize_delivery)
+        return None
     
-    # Calculate average review score by delivery category
-    delivery_satisfaction = sales_data.groupby('delivery_category')['review_score'].mean().reset_index()
-    delivery_satisfaction = delivery_satisfaction[delivery_satisfaction['delivery_category'] != 'Unknown']
+    # Categorize delivery days in one vectorized pass (NaN days fall outside every bin)
+    delivery_category = pd.cut(
+        sales_data['delivery_days'],
+        bins=[-np.inf, 3, 7, np.inf],
+        labels=['1-3 days', '4-7 days', '8+ days']
+    )
     
-    # Order categories properly
-    category_order = ['1-3 days', '4-7 days', '8+ days']
-    delivery_satisfaction['delivery_category'] = pd.Categorical(
-        delivery_satisfaction['delivery_category'], 
-        categories=category_order, 
-        ordered=True
+    # Calculate average review score by delivery category (already in bin order)
+    delivery_satisfaction = (
+        sales_data['review_score']
+        .groupby(delivery_category, observed=True)
+        .mean()
+        .rename_axis('delivery_category')
+        .reset_index()
     )
-    delivery_satisfaction = delivery_satisfaction.sort_values('delivery_category')
+    
+    return delivery_satisfaction
+
+
+def create_satisfaction_delivery_chart(delivery_satisfaction):
+    """Create satisfaction vs delivery time chart"""
+    if delivery_satisfaction is None:
+        return _missing("Delivery or review data not available")
     
     fig = go.Figure(data=[
         go.Bar(
@@ -368,7 +449,7 @@ def main():
     with col2:
         # Year filter with default to 2023
         orders_data = processed_data['orders']
-        available_years = sorted(orders_data['year'].unique(), reverse=True)
+        available_years = sorted(orders_data['year'].dropna().unique(), reverse=True)
         
         default_year_index = 0
         if 2023 in available_years:
@@ -407,59 +488,39 @@ def main():
         )
     
     # Create datasets based on selected filters
-    current_data = loader.create_sales_dataset(
-        year_filter=selected_year,
-        month_filter=selected_month,
-        status_filter='delivered'
-    )
-    
     # Apply additional date range filter if needed
-    if len(date_range) == 2:
-        start_date, end_date = date_range
-        current_data = current_data[
-            (current_data['order_purchase_timestamp'].dt.date >= start_date) &
-            (current_data['order_purchase_timestamp'].dt.date <= end_date)
-        ]
+    date_bounds = tuple(date_range) if len(date_range) == 2 else None
+    current_data = get_filtered_sales_dataset(loader, selected_year, selected_month, 'delivered', date_bounds)
     
     # Set up comparison year data
     current_year = selected_year
     previous_year = selected_year - 1
     
-    # Get previous year data with same month filter for comparison
-    if previous_year in available_years:
-        previous_data = loader.create_sales_dataset(
-            year_filter=previous_year,
-            month_filter=selected_month,
-            status_filter='delivered'
-        )
-        
-        # Apply same date range adjustment if needed
-        if len(date_range) == 2:
-            previous_data = previous_data[
-                (previous_data['order_purchase_timestamp'].dt.date >= start_date.replace(year=previous_year)) &
-                (previous_data['order_purchase_timestamp'].dt.date <= end_date.replace(year=previous_year))
-            ]
-    else:
-        previous_data = pd.DataFrame()
-    
     current_year_data = current_data
     
-    # Import business_metrics functions
-    from business_metrics import (
-        calculate_revenue_metrics,
-        calculate_monthly_growth_trend,
-        calculate_average_order_value,
-        calculate_order_count_metrics
-    )
+    # Chart aggregates are cached per filter combination; the chart builders only read these
+    current_aggregates = get_chart_aggregates(loader, current_year, selected_month, 'delivered', date_bounds)
     
-    # Calculate KPI metrics using business functions
-    revenue_metrics = calculate_revenue_metrics(current_data, current_year, previous_year)
-    order_metrics = calculate_order_count_metrics(current_data, current_year, previous_year)
-    aov_metrics = calculate_average_order_value(current_data, current_year, previous_year)
+    # Previous year uses the same month filter and date range, shifted back one year
+    previous_bounds = None
+    if date_bounds is not None:
+        previous_bounds = tuple(shift_back_one_year(bound) for bound in date_bounds)
     
-    # Calculate monthly growth for current year
-    monthly_growth = calculate_monthly_growth_trend(current_year_data, current_year)
-    avg_monthly_growth = monthly_growth.mean() if len(monthly_growth) > 0 else 0
+    # Get previous year trend for comparison
+    previous_monthly = None
+    if previous_year in available_years:
+        previous_monthly = get_monthly_revenue(
+            loader, previous_year, selected_month, 'delivered', previous_bounds
+        )
+    
+    # Calculate KPI metrics using business functions (cached per filter combination)
+    kpi_metrics = get_kpi_metrics(
+        loader, current_year, previous_year, selected_month, 'delivered', date_bounds, previous_bounds
+    )
+    revenue_metrics = kpi_metrics['revenue']
+    order_metrics = kpi_metrics['orders']
+    aov_metrics = kpi_metrics['aov']
+    avg_monthly_growth = kpi_metrics['avg_monthly_growth']
     
     # KPI Row - 4 cards with trend indicators (red for negative, green for positive)
     st.markdown("<br>", unsafe_allow_html=True)
@@ -472,15 +533,7 @@ def main():
         
         value_display = f"{value:.2f}%" if is_percentage else format_currency(value)
         
-        return f"""
-        <div class="metric-card">
-            <p class="metric-label">{title}</p>
-            <p class="metric-value">{value_display}</p>
-            <p class="metric-trend" style="color: {trend_color};">
-                <span style="font-size: 16px;">{trend_arrow}</span> {abs(trend):.2f}%
-            </p>
-        </div>
-        """
+        return _KPI_TMPL.format(title, value_display, trend_color, trend_arrow, abs(trend))
     
     with kpi1:
         st.markdown(
@@ -514,22 +567,22 @@ def main():
     chart_row1_col1, chart_row1_col2 = st.columns(2)
     
     with chart_row1_col1:
-        revenue_fig = create_revenue_trend_chart(current_year_data, previous_data, current_year, previous_year)
+        revenue_fig = create_revenue_trend_chart(current_aggregates['month'], previous_monthly, current_year, previous_year)
         st.plotly_chart(revenue_fig, use_container_width=True)
     
     with chart_row1_col2:
-        category_fig = create_category_chart(current_year_data)
+        category_fig = create_category_chart(current_aggregates.get('category'))
         st.plotly_chart(category_fig, use_container_width=True)
     
     chart_row2_col1, chart_row2_col2 = st.columns(2)
     
     with chart_row2_col1:
-        satisfaction_fig = create_satisfaction_delivery_chart(current_year_data)
+        satisfaction_fig = create_satisfaction_delivery_chart(current_aggregates['delivery'])
         st.plotly_chart(satisfaction_fig, use_container_width=True)
     
     with chart_row2_col2:
         # Geographic Performance Chart (Revenue by Top States)
-        geographic_fig = create_geographic_chart(current_year_data)
+        geographic_fig = create_geographic_chart(current_aggregates.get('state'))
         st.plotly_chart(geographic_fig, use_container_width=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
@@ -549,25 +602,13 @@ def main():
             value_display = f'<div style="font-size: 32px; font-weight: bold; color: #333;">{value:.1f} days</div>'
             subtitle_display = f'<div style="font-size: 14px; color: #666; margin-top: 5px;">{subtitle}</div>' if subtitle else ""
         
-        return f"""
-        <div class="bottom-card">
-            <div style="font-size: 16px; color: #333; font-weight: 600; margin-bottom: 15px;">{title}</div>
-            {value_display}
-            {subtitle_display}
-        </div>
-        """
+        return _BOTTOM_CARD_TMPL.format(title, value_display, subtitle_display)
     
     with bottom_col1:
         # Average delivery time with trend indicator
-        if 'order_delivered_customer_date' in current_year_data.columns:
-            # Calculate delivery days
-            delivery_data = current_year_data.copy()
-            delivery_data['delivery_days'] = (
-                pd.to_datetime(delivery_data['order_delivered_customer_date']) - 
-                pd.to_datetime(delivery_data['order_purchase_timestamp'])
-            ).dt.days
-            
-            avg_delivery_days = delivery_data['delivery_days'].mean()
+        if 'delivery_days' in current_year_data.columns:
+            # Delivery days are derived once per order by the data loader
+            avg_delivery_days = current_year_data['delivery_days'].mean()
             
             st.markdown(
                 create_bottom_card("Average Delivery Time", avg_delivery_days, "Days from order to delivery"),
@@ -579,8 +620,9 @@ def main():
     with bottom_col2:
         # Review Score with large stars
         if 'review_score' in current_year_data.columns:
-            order_level_data = current_year_data.drop_duplicates('order_id')
-            avg_review_score = order_level_data['review_score'].mean()
+            # One review per order: mask first occurrences of order_id, no full-row dedup copy
+            first_per_order = ~current_year_data['order_id'].duplicated()
+            avg_review_score = current_year_data['review_score'][first_per_order].mean()
             
             st.markdown(
                 create_bottom_card("Review Score", avg_review_score, "Average Review Score", is_stars=True),
@@ -10,6 +10,17 @@ import warnings
 warnings.filterwarnings('ignore')
 
 
+def _shared_categorical_dtype(*columns: pd.Series) -> pd.CategoricalDtype:
+    """
+    Build one categorical dtype covering every value of the given key columns.
+    
+    Tables whose join keys share a dtype merge on integer codes; differing
+    category sets would make pandas fall back to object keys.
+    """
+    values = pd.concat(columns, ignore_index=True).dropna()
+    return pd.CategoricalDtype(pd.unique(values))
+
+
 class EcommerceDataLoader:
     """
     A class for loading and processing e-commerce data.
@@ -74,12 +85,25 @@ class EcommerceDataLoader:
                 orders[col] = pd.to_datetime(orders[col])
         
         # Extract date components for compatibility with business_metrics.py
-        orders['year'] = orders['order_purchase_timestamp'].dt.year
-        orders['month'] = orders['order_purchase_timestamp'].dt.month
-        orders['purchase_year'] = orders['order_purchase_timestamp'].dt.year
-        orders['purchase_month'] = orders['order_purchase_timestamp'].dt.month
+        # (narrow nullable integer dtypes; years and months fit in Int16 / Int8, and an
+        # order without a purchase timestamp keeps a missing value instead of failing the load)
+        purchase_year = orders['order_purchase_timestamp'].dt.year.astype('Int16')
+        purchase_month = orders['order_purchase_timestamp'].dt.month.astype('Int8')
+        orders['year'] = purchase_year
+        orders['month'] = purchase_month
+        orders['purchase_year'] = purchase_year
+        orders['purchase_month'] = purchase_month
         orders['purchase_date'] = orders['order_purchase_timestamp'].dt.date
         
+        # Delivery time is a per-order quantity; derive it once here rather than per sales dataset
+        orders['delivery_days'] = (
+            orders['order_delivered_customer_date'] - 
+            orders['order_purchase_timestamp']
+        ).dt.days.astype('Int16')
+        
+        # Store status as categorical so value_counts/filters work on integer codes
+        orders['order_status'] = orders['order_status'].astype('category')
+        
         return orders
     
     def clean_order_items_data(self) -> pd.DataFrame:
@@ -115,8 +139,42 @@ class EcommerceDataLoader:
             if col in reviews.columns:
                 reviews[col] = pd.to_datetime(reviews[col])
         
+        # Scores are 1-5; nullable Int8 keeps them narrow through left joins that add missing values
+        if 'review_score' in reviews.columns:
+            reviews['review_score'] = reviews['review_score'].astype('Int8')
+        
         return reviews
     
+    def clean_products_data(self) -> pd.DataFrame:
+        """
+        Clean and process products data.
+        
+        Returns:
+            pd.DataFrame: Cleaned products data
+        """
+        products = self.raw_data['products'].copy()
+        
+        # Low-cardinality label used as a group-by key; store as categorical codes
+        if 'product_category_name' in products.columns:
+            products['product_category_name'] = products['product_category_name'].astype('category')
+        
+        return products
+    
+    def clean_customers_data(self) -> pd.DataFrame:
+        """
+        Clean and process customers data.
+        
+        Returns:
+            pd.DataFrame: Cleaned customers data
+        """
+        customers = self.raw_data['customers'].copy()
+        
+        # Low-cardinality label used as a group-by key; store as categorical codes
+        if 'customer_state' in customers.columns:
+            customers['customer_state'] = customers['customer_state'].astype('category')
+        
+        return customers
+    
     def create_sales_dataset(self, year_filter: Optional[int] = None, 
                            month_filter: Optional[int] = None,
                            status_filter: str = 'delivered') -> pd.DataFrame:
@@ -138,7 +196,8 @@ class EcommerceDataLoader:
         sales_data = sales_data.merge(
             self.processed_data['orders'][['order_id', 'customer_id', 'order_status', 
                                          'order_purchase_timestamp', 'order_delivered_customer_date',
-                                         'purchase_year', 'purchase_month', 'year', 'month']],
+                                         'purchase_year', 'purchase_month', 'year', 'month',
+                                         'delivery_days']],
             on='order_id',
             how='left'
         )
@@ -155,35 +214,35 @@ class EcommerceDataLoader:
             sales_data = sales_data[sales_data['purchase_month'] == month_filter]
         
         # Add product information
-        if 'products' in self.raw_data:
+        if 'products' in self.processed_data:
             sales_data = sales_data.merge(
-                self.raw_data['products'][['product_id', 'product_category_name']],
+                self.processed_data['products'][['product_id', 'product_category_name']],
                 on='product_id',
                 how='left'
             )
         
         # Add customer information (avoid duplicate joins)
-        if 'customers' in self.raw_data and 'customer_id' in sales_data.columns:
+        if 'customers' in self.processed_data and 'customer_id' in sales_data.columns:
             sales_data = sales_data.merge(
-                self.raw_data['customers'][['customer_id', 'customer_state', 'customer_city']],
+                self.processed_data['customers'][['customer_id', 'customer_state', 'customer_city']],
                 on='customer_id',
                 how='left'
             )
         
         # Add review information
-        if 'reviews' in self.raw_data:
+        if 'reviews' in self.processed_data:
             sales_data = sales_data.merge(
-                self.raw_data['reviews'][['order_id', 'review_score']],
+                self.processed_data['reviews'][['order_id', 'review_score']],
                 on='order_id',
                 how='left'
             )
         
-        # Calculate delivery metrics
-        if 'order_delivered_customer_date' in sales_data.columns and 'order_purchase_timestamp' in sales_data.columns:
-            sales_data['delivery_days'] = (
-                sales_data['order_delivered_customer_date'] - 
-                sales_data['order_purchase_timestamp']
-            ).dt.days
+        # Order rows by purchase time so year/month periods are contiguous blocks
+        # (lets business_metrics slice periods by binary search without re-sorting)
+        if 'order_purchase_timestamp' in sales_data.columns:
+            sales_data = sales_data.sort_values(
+                'order_purchase_timestamp', kind='stable', ignore_index=True
+            )
         
         return sales_data
     
@@ -201,11 +260,41 @@ class EcommerceDataLoader:
         self.processed_data['orders'] = self.clean_orders_data()
         self.processed_data['order_items'] = self.clean_order_items_data()
         
+        if 'products' in self.raw_data:
+            self.processed_data['products'] = self.clean_products_data()
+        
+        if 'customers' in self.raw_data:
+            self.processed_data['customers'] = self.clean_customers_data()
+        
         if 'reviews' in self.raw_data:
             self.processed_data['reviews'] = self.clean_reviews_data()
         
+        self.categorize_ids()
+        
         return self.processed_data
     
+    def categorize_ids(self) -> None:
+        """
+        Store order, customer and product IDs as categoricals shared across tables.
+        
+        Each ID gets one categorical dtype spanning every processed table that
+        carries it, so create_sales_dataset joins on integer codes and the
+        resulting sales data keeps compact ID columns.
+        """
+        for id_col in ('order_id', 'customer_id', 'product_id'):
+            tables = [
+                name for name, df in self.processed_data.items()
+                if id_col in df.columns
+            ]
+            if not tables:
+                continue
+            
+            dtype = _shared_categorical_dtype(
+                *(self.processed_data[name][id_col] for name in tables)
+            )
+            for name in tables:
+                self.processed_data[name][id_col] = self.processed_data[name][id_col].astype(dtype)
+    
     def get_data_summary(self) -> Dict[str, Dict]:
         """
         Get summary statistics for all datasets.